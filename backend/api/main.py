@@ -3,16 +3,20 @@ FastAPI application with Strawberry GraphQL integration
 Main entry point for the backend API
 """
 
+import orjson
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from strawberry.fastapi import GraphQLRouter
-from graphql_schema.schema import schema
+from strawberry.http import GraphQLHTTPResponse
+from graphql_schema.schema import schema, IS_PRODUCTION
 
 # Initialize FastAPI app
 app = FastAPI(
     title="SwasthiQ EMR - Appointment Management API",
     description="GraphQL API for appointment scheduling and management",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS for frontend access
@@ -28,8 +32,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Create GraphQL router
-graphql_app = GraphQLRouter(schema)
+class ORJSONGraphQLRouter(GraphQLRouter):
+    """GraphQL router that serializes responses with orjson instead of stdlib json"""
+    
+    def encode_json(self, response_data: GraphQLHTTPResponse) -> str:
+        return orjson.dumps(response_data).decode()
+
+
+# Create GraphQL router (GraphiQL needs introspection, so dev only)
+graphql_app = ORJSONGraphQLRouter(schema, graphiql=not IS_PRODUCTION)
 
 # Mount GraphQL endpoint
 app.include_router(graphql_app, prefix="/graphql")
@@ -7,7 +7,6 @@ import strawberry
 from typing import Optional
 from graphql_schema.types import Appointment, CreateAppointmentInput, UpdateAppointmentStatusInput, MutationResponse
 from services import appointment_service
-from models.appointment import CreateAppointmentInput as PydanticCreateInput
 
 
 @strawberry.type
@@ -45,32 +44,12 @@ class Mutation:
               }
             }
         """
-        # Convert Strawberry input to Pydantic model for validation
-        pydantic_input = PydanticCreateInput(
-            patient_name=input.patient_name,
-            date=input.date,
-            time=input.time,
-            duration=input.duration,
-            doctor_name=input.doctor_name,
-            mode=input.mode,
-            status=input.status
-        )
+        # Service validates the raw fields once and returns the stored row
+        # (will raise ValueError if validation fails or conflict)
+        created_appointment = appointment_service.create_appointment(strawberry.asdict(input))
         
-        # Call service layer (will raise ValueError if conflict)
-        created_appointment = appointment_service.create_appointment(pydantic_input)
-        
-        # Convert response to Strawberry type
-        return Appointment(
-            id=created_appointment.id,
-            patient_name=created_appointment.patient_name,
-            date=created_appointment.date,
-            time=created_appointment.time,
-            duration=created_appointment.duration,
-            doctor_name=created_appointment.doctor_name,
-            status=created_appointment.status,
-            mode=created_appointment.mode,
-            created_at=created_appointment.created_at
-        )
+        # Row keys match Strawberry field names
+        return Appointment(**created_appointment)
     
     @strawberry.mutation
     def update_appointment_status(self, id: str, status: str) -> Appointment:
@@ -94,17 +73,7 @@ class Mutation:
         """
         updated_appointment = appointment_service.update_appointment_status(id, status)
         
-        return Appointment(
-            id=updated_appointment.id,
-            patient_name=updated_appointment.patient_name,
-            date=updated_appointment.date,
-            time=updated_appointment.time,
-            duration=updated_appointment.duration,
-            doctor_name=updated_appointment.doctor_name,
-            status=updated_appointment.status,
-            mode=updated_appointment.mode,
-            created_at=updated_appointment.created_at
-        )
+        return Appointment(**updated_appointment.model_dump())
     
     @strawberry.mutation
     def delete_appointment(self, id: str) -> MutationResponse:
@@ -42,28 +42,19 @@ class Query:
               }
             }
         """
-        # Call service layer
-        appointments = appointment_service.get_appointments(
+        # Call service layer (raw rows - already validated on write)
+        appointments = appointment_service._iter_appointments(
             date=date,
             status=status,
             doctor_name=doctor_name
         )
         
-        # Convert Pydantic models to Strawberry types
-        return [
-            Appointment(
-                id=apt.id,
-                patient_name=apt.patient_name,
-                date=apt.date,
-                time=apt.time,
-                duration=apt.duration,
-                doctor_name=apt.doctor_name,
-                status=apt.status,
-                mode=apt.mode,
-                created_at=apt.created_at
-            )
-            for apt in appointments
-        ]
+        # Row keys match Strawberry field names, no Pydantic round-trip needed.
+        # A generator lets graphql-core complete each item as it is built
+        # instead of holding a second list of N objects. The annotation stays
+        # List[Appointment] because Strawberry only maps list/tuple/Sequence
+        # to a GraphQL list; graphql-core accepts any iterable at runtime.
+        return (Appointment(**apt) for apt in appointments)
     
     @strawberry.field
     def appointment(self, id: str) -> Optional[Appointment]:
@@ -76,20 +67,9 @@ class Query:
         Returns:
             Appointment object or None if not found
         """
-        appointments = appointment_service.get_appointments()
+        apt = appointment_service.get_appointment_by_id(id)
         
-        for apt in appointments:
-            if apt.id == id:
-                return Appointment(
-                    id=apt.id,
-                    patient_name=apt.patient_name,
-                    date=apt.date,
-                    time=apt.time,
-                    duration=apt.duration,
-                    doctor_name=apt.doctor_name,
-                    status=apt.status,
-                    mode=apt.mode,
-                    created_at=apt.created_at
-                )
+        if apt is None:
+            return None
         
-        return None
+        return Appointment(**apt)
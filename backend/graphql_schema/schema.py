@@ -3,13 +3,57 @@ GraphQL Schema definition
 Combines queries and mutations into a single schema
 """
 
+import os
+from typing import Iterator
+
 import strawberry
+from graphql import GraphQLError
+from graphql.validation import NoSchemaIntrospectionCustomRule
+from strawberry.extensions import AddValidationRules, ParserCache, ValidationCache
 from graphql_schema.queries import Query
 from graphql_schema.mutations import Mutation
 
 
-# Create the complete GraphQL schema
+# Clients send the same handful of operations repeatedly, so memoize the
+# parse and validate stages (LRU keyed on query text / parsed document)
+QUERY_CACHE_SIZE = 256
+
+# Introspection exposes the whole type graph and is only needed by dev tooling
+IS_PRODUCTION = os.getenv("ENV") == "prod"
+
+
+class SafeParserCache(ParserCache):
+    """
+    ParserCache that lets syntax errors fall through to Strawberry's own
+    parse step, so malformed queries still return a GraphQL error response
+    instead of raising out of the extension hook
+    """
+    
+    def on_parse(self) -> Iterator[None]:
+        execution_context = self.execution_context
+        
+        try:
+            execution_context.graphql_document = self.cached_parse_document(
+                execution_context.query, **execution_context.parse_options
+            )
+        except GraphQLError:
+            pass
+        yield
+
+
+extensions = [
+    SafeParserCache(maxsize=QUERY_CACHE_SIZE),
+    ValidationCache(maxsize=QUERY_CACHE_SIZE),
+]
+
+if IS_PRODUCTION:
+    extensions.append(AddValidationRules([NoSchemaIntrospectionCustomRule]))
+
+
+# Create the complete GraphQL schema (built once per process at import;
+# run workers with --preload to share it copy-on-write)
 schema = strawberry.Schema(
     query=Query,
-    mutation=Mutation
+    mutation=Mutation,
+    extensions=extensions
 )
@@ -11,6 +11,13 @@ from datetime import datetime
 @strawberry.type
 class Appointment:
     """GraphQL type for Appointment - matches AppointmentResponse from Pydantic"""
+    # Declared in the class body so the generated dataclass has no per-instance
+    # __dict__ (strawberry.type has no slots option). Fields must stay default-free.
+    __slots__ = (
+        "id", "patient_name", "date", "time", "duration",
+        "doctor_name", "status", "mode", "created_at",
+    )
+    
     id: str
     patient_name: str
     date: str
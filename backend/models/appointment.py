@@ -3,11 +3,34 @@ Pydantic models for Appointment data validation.
 Aligned with SwasthiQ's clinical data validation requirements.
 """
 
-from datetime import datetime
+import re
 from typing import Optional, Literal
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 
 
+# Longest bookable appointment; conflict detection relies on this bound
+MAX_DURATION_MINUTES = 240
+
+# Field patterns mirror what strptime('%Y-%m-%d') / strptime('%H:%M') accept
+# (zero padding optional), without allocating a datetime per validation
+_DATE_RE = re.compile(r"(\d{4})-(1[0-2]|0[1-9]|[1-9])-(3[01]|[12]\d|0[1-9]|[1-9])")
+_TIME_RE = re.compile(r"(2[0-3]|[01]\d|\d):([0-5]\d|\d)")
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _is_valid_date(v: str) -> bool:
+    """Check a YYYY-MM-DD string is a real calendar date"""
+    m = _DATE_RE.fullmatch(v)
+    if not m:
+        return False
+    year, month, day = int(m[1]), int(m[2]), int(m[3])
+    if year < 1:
+        return False
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return day <= 29
+    return day <= _DAYS_IN_MONTH[month]
+
+
 class AppointmentBase(BaseModel):
     """Base appointment model with shared fields"""
     patient_name: str = Field(
@@ -27,7 +50,7 @@ class AppointmentBase(BaseModel):
     duration: int = Field(
         ...,
         ge=15,  # Minimum 15 minutes
-        le=240,  # Maximum 4 hours
+        le=MAX_DURATION_MINUTES,  # Maximum 4 hours
         description="Appointment duration in minutes"
     )
     doctor_name: str = Field(
@@ -45,21 +68,17 @@ class AppointmentBase(BaseModel):
     @classmethod
     def validate_date_format(cls, v: str) -> str:
         """Validate date is in correct format"""
-        try:
-            datetime.strptime(v, '%Y-%m-%d')
-            return v
-        except ValueError:
+        if not _is_valid_date(v):
             raise ValueError('Date must be in YYYY-MM-DD format')
+        return v
     
     @field_validator('time')
     @classmethod
     def validate_time_format(cls, v: str) -> str:
         """Validate time is in correct format"""
-        try:
-            datetime.strptime(v, '%H:%M')
-            return v
-        except ValueError:
+        if not _TIME_RE.fullmatch(v):
             raise ValueError('Time must be in HH:MM format (24-hour)')
+        return v
 
 
 class CreateAppointmentInput(AppointmentBase):
@@ -129,9 +148,6 @@ class AppointmentFilters(BaseModel):
     @classmethod
     def validate_date_if_present(cls, v: Optional[str]) -> Optional[str]:
         """Validate date format if provided"""
-        if v is not None:
-            try:
-                datetime.strptime(v, '%Y-%m-%d')
-            except ValueError:
-                raise ValueError('Date must be in YYYY-MM-DD format')
+        if v is not None and not _is_valid_date(v):
+            raise ValueError('Date must be in YYYY-MM-DD format')
         return v
@@ -0,0 +1,45 @@
+"""
+Integer overlap kernel for appointment conflict detection
+Compiled with Numba when it is installed, vectorized NumPy otherwise
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    njit = None
+
+
+def _any_overlap_vectorized(starts, ends, new_start, new_end):
+    """One fused NumPy pass over the arrays, no Python-level loop"""
+    return bool(np.any((starts < new_end) & (new_start < ends)))
+
+
+if njit is not None:
+    @njit(cache=True)
+    def any_overlap(starts, ends, new_start, new_end):
+        """
+        Check whether [new_start, new_end) overlaps any [starts[i], ends[i])
+
+        Args:
+            starts: Start minutes of existing slots (int array)
+            ends: End minutes of existing slots (int array, same length)
+            new_start: Start minute of the candidate slot
+            new_end: End minute of the candidate slot
+
+        Returns:
+            True on the first overlapping slot, False if none overlap
+        """
+        for i in range(starts.size):
+            # Two intervals overlap if: start1 < end2 AND start2 < end1
+            if starts[i] < new_end and new_start < ends[i]:
+                return True
+        return False
+else:
+    any_overlap = _any_overlap_vectorized
+
+
+# Compile (or load the cached build) at import so the JIT cost is paid at
+# startup rather than on the first booking request that has a neighbour
+any_overlap(np.empty(0, np.int16), np.empty(0, np.int16), 0, 0)
@@ -8,21 +8,28 @@ PRODUCTION NOTES:
 - AppSync subscriptions would trigger on mutations for real-time updates
 """
 
-from datetime import datetime, timedelta
-from typing import List, Optional, Dict
-from uuid import uuid4
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from operator import itemgetter
+from secrets import token_hex
+from typing import Iterator, List, Optional, Dict, Tuple
+import numpy as np
 from models.appointment import (
     AppointmentResponse,
     CreateAppointmentInput,
+    MAX_DURATION_MINUTES,
 )
+from utils.conflict_detector import time_to_minutes
+from services._overlap_kernel import any_overlap
 
 
 # ==============================================
 # MOCK DATABASE (Simulating PostgreSQL Tables)
 # ==============================================
 
-# In production: This would be Aurora PostgreSQL table
-appointments_db: List[Dict] = [
+# In production: This would be Aurora PostgreSQL table (primary key: id)
+appointments_db: Dict[str, Dict] = {apt["id"]: apt for apt in [
     {
         "id": "apt-001",
         "patient_name": "Rajesh Kumar",
@@ -155,13 +162,115 @@ appointments_db: List[Dict] = [
         "mode": "Video",
         "created_at": "2025-12-26T21:00:00Z"
     },
-]
+]}
+
+
+# ==============================================
+# SECONDARY INDEXES (Simulating PostgreSQL Indexes)
+# ==============================================
+
+# In production: Composite index on (doctor_id, date), indexes on date and doctor_id.
+# appointments_db stays the source of truth; these mirror every insert/delete.
+# Each (doctor, date) bucket holds (start_minutes, end_minutes, row) entries,
+# kept sorted by start so conflict detection can bisect to the candidate window
+# and compare cached ints instead of re-parsing "HH:MM" strings.
+_by_doctor_date: Dict[Tuple[str, str], List[Tuple[int, int, Dict]]] = defaultdict(list)
+# Date and doctor buckets are keyed by id (insertion-ordered) for O(1) delete
+_by_date: Dict[str, Dict[str, Dict]] = defaultdict(dict)
+_by_doctor: Dict[str, Dict[str, Dict]] = defaultdict(dict)
+
+# int16 start/end minutes parallel to each (doctor, date) bucket, fed to the
+# overlap kernel. Non-blocking rows are stored as the empty interval (0, 0),
+# which can never overlap, so slices stay aligned with the sorted bucket.
+# Arrays are updated at the entry's position, never rebuilt from the bucket.
+_busy_starts: Dict[Tuple[str, str], np.ndarray] = {}
+_busy_ends: Dict[Tuple[str, str], np.ndarray] = {}
+
+NON_BLOCKING_STATUSES = ("Cancelled", "Completed")
+
+_start_key = itemgetter(0)
+
+
+def _busy_interval(start_min: int, end_min: int, apt: Dict) -> Tuple[int, int]:
+    """Interval stored in the kernel arrays: (0, 0) if the row doesn't block"""
+    if apt["status"] in NON_BLOCKING_STATUSES:
+        return 0, 0
+    return start_min, end_min
+
+
+def _bucket_position(bucket: List[Tuple[int, int, Dict]], apt: Dict) -> int:
+    """Locate a row's entry in its sorted (doctor, date) bucket"""
+    i = bisect_left(bucket, time_to_minutes(apt["time"]), key=_start_key)
+    while bucket[i][2] is not apt:
+        i += 1
+    return i
+
+
+def _index_appointment(apt: Dict) -> None:
+    """Add an appointment row to the secondary indexes"""
+    start_min = time_to_minutes(apt["time"])
+    end_min = start_min + apt["duration"]
+    key = (apt["doctor_name"], apt["date"])
+    bucket = _by_doctor_date[key]
+    i = bisect_right(bucket, start_min, key=_start_key)
+    bucket.insert(i, (start_min, end_min, apt))
+    
+    busy_start, busy_end = _busy_interval(start_min, end_min, apt)
+    if key in _busy_starts:
+        _busy_starts[key] = np.insert(_busy_starts[key], i, busy_start)
+        _busy_ends[key] = np.insert(_busy_ends[key], i, busy_end)
+    else:
+        _busy_starts[key] = np.array([busy_start], dtype=np.int16)
+        _busy_ends[key] = np.array([busy_end], dtype=np.int16)
+    
+    _by_date[apt["date"]][apt["id"]] = apt
+    _by_doctor[apt["doctor_name"]][apt["id"]] = apt
+
+
+def _unindex_appointment(apt: Dict) -> None:
+    """Remove an appointment row from the secondary indexes"""
+    key = (apt["doctor_name"], apt["date"])
+    bucket = _by_doctor_date[key]
+    i = _bucket_position(bucket, apt)
+    del bucket[i]
+    if bucket:
+        _busy_starts[key] = np.delete(_busy_starts[key], i)
+        _busy_ends[key] = np.delete(_busy_ends[key], i)
+    else:
+        del _by_doctor_date[key]
+        del _busy_starts[key]
+        del _busy_ends[key]
+    date_bucket = _by_date[apt["date"]]
+    del date_bucket[apt["id"]]
+    if not date_bucket:
+        del _by_date[apt["date"]]
+    doctor_bucket = _by_doctor[apt["doctor_name"]]
+    del doctor_bucket[apt["id"]]
+    if not doctor_bucket:
+        del _by_doctor[apt["doctor_name"]]
+
+
+def _reindex_status(apt: Dict) -> None:
+    """Refresh a row's kernel slot after its status changed"""
+    key = (apt["doctor_name"], apt["date"])
+    bucket = _by_doctor_date[key]
+    i = _bucket_position(bucket, apt)
+    start_min, end_min, _ = bucket[i]
+    _busy_starts[key][i], _busy_ends[key][i] = _busy_interval(start_min, end_min, apt)
+
+
+for _apt in appointments_db.values():
+    _index_appointment(_apt)
 
 
 # ==============================================
 # UTILITY FUNCTIONS
 # ==============================================
 
+# UTC ISO-8601 timestamp with a literal "Z" suffix, e.g. 2025-12-26T10:30:00.000000Z
+CREATED_AT_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+
 def parse_time(time_str: str) -> datetime:
     """Convert time string to datetime for comparison"""
     return datetime.strptime(time_str, '%H:%M')
@@ -174,24 +283,62 @@ def calculate_end_time(start_time: str, duration: int) -> str:
     return end_dt.strftime('%H:%M')
 
 
-def check_time_overlap(start1: str, end1: str, start2: str, end2: str) -> bool:
+def check_time_overlap(start1: int, end1: int, start2: int, end2: int) -> bool:
     """
-    Check if two time ranges overlap
+    Check if two time ranges (minutes since midnight) overlap
     Returns True if there is overlap, False otherwise
     """
-    start1_dt = parse_time(start1)
-    end1_dt = parse_time(end1)
-    start2_dt = parse_time(start2)
-    end2_dt = parse_time(end2)
-    
     # Check for overlap: intervals overlap if start1 < end2 AND start2 < end1
-    return start1_dt < end2_dt and start2_dt < end1_dt
+    return start1 < end2 and start2 < end1
 
 
 # ==============================================
 # CORE SERVICE FUNCTIONS (API Contract)
 # ==============================================
 
+def _iter_appointments(
+    date: Optional[str] = None,
+    status: Optional[str] = None,
+    doctor_name: Optional[str] = None
+) -> Iterator[Dict]:
+    """
+    Iterate appointment rows with optional filters, without model conversion
+    
+    Rows are validated on write, so read paths that only need the field
+    values (e.g. GraphQL resolvers) can use the stored dicts directly.
+    Rows are yielded straight from the indexes without copying, so the
+    caller is the single materialization point and must finish iterating
+    before mutating appointments.
+    
+    Args:
+        date: Filter by appointment date (YYYY-MM-DD)
+        status: Filter by appointment status
+        doctor_name: Filter by doctor's name
+    
+    Yields:
+        Appointment dicts matching filters
+    """
+    # Start from the narrowest index covering the date/doctor filters;
+    # status has low selectivity, so it is applied inline on that slice
+    if date and doctor_name:
+        # Ordered by start time rather than insertion
+        candidates = (apt for _, _, apt in _by_doctor_date.get((doctor_name, date), ()))
+    elif date:
+        candidates = _by_date.get(date, {}).values()
+    elif doctor_name:
+        candidates = _by_doctor.get(doctor_name, {}).values()
+    else:
+        candidates = appointments_db.values()
+    
+    if not status:
+        yield from candidates
+        return
+    
+    for apt in candidates:
+        if apt["status"] == status:
+            yield apt
+
+
 def get_appointments(
     date: Optional[str] = None,
     status: Optional[str] = None,
@@ -213,35 +360,35 @@ def get_appointments(
     Returns:
         List of appointments matching filters
     """
-    filtered_appointments = appointments_db.copy()
-    
-    # Apply filters
-    if date:
-        filtered_appointments = [
-            apt for apt in filtered_appointments 
-            if apt["date"] == date
-        ]
-    
-    if status:
-        filtered_appointments = [
-            apt for apt in filtered_appointments 
-            if apt["status"] == status
-        ]
-    
-    if doctor_name:
-        filtered_appointments = [
-            apt for apt in filtered_appointments 
-            if apt["doctor_name"] == doctor_name
-        ]
-    
-    # Convert to response models
+    # Convert to response models. model_construct skips field_validators,
+    # which is safe here because every row was validated on insert.
     return [
-        AppointmentResponse(**apt) 
-        for apt in filtered_appointments
+        AppointmentResponse.model_construct(**apt) 
+        for apt in _iter_appointments(
+            date=date,
+            status=status,
+            doctor_name=doctor_name
+        )
     ]
 
 
-def create_appointment(input_data: CreateAppointmentInput) -> AppointmentResponse:
+def get_appointment_by_id(appointment_id: str) -> Optional[Dict]:
+    """
+    Look up a single appointment row by ID
+    
+    PRODUCTION IMPLEMENTATION:
+    - SELECT * FROM appointments WHERE id = $1 (primary key lookup)
+    
+    Args:
+        appointment_id: Unique appointment identifier
+    
+    Returns:
+        Stored appointment dict (treat as read-only) or None if not found
+    """
+    return appointments_db.get(appointment_id)
+
+
+def create_appointment(data: Dict) -> Dict:
     """
     Create a new appointment with conflict detection
     
@@ -260,42 +407,56 @@ def create_appointment(input_data: CreateAppointmentInput) -> AppointmentRespons
     - Return cached response if duplicate detected
     
     Args:
-        input_data: Validated appointment data from Pydantic model
+        data: Raw appointment fields, validated here via CreateAppointmentInput
     
     Returns:
-        Created appointment object
+        Created appointment row (keys match AppointmentResponse fields)
     
     Raises:
         ValueError: If time conflict detected or validation fails
     """
     
+    # Single validation pass on the write path
+    input_data = CreateAppointmentInput.model_validate(data)
+    
     # Generate unique ID (in production: database auto-generated)
-    new_id = f"apt-{uuid4().hex[:8]}"
+    # 8 hex chars = 32 bits, so collisions become likely past ~65k rows;
+    # the id-keyed store makes re-drawing on a clash cheap
+    new_id = f"apt-{token_hex(4)}"
+    while new_id in appointments_db:
+        new_id = f"apt-{token_hex(4)}"
     
-    # Calculate end time for conflict detection
-    new_end_time = calculate_end_time(input_data.time, input_data.duration)
+    # Calculate start/end minutes once for conflict detection
+    new_start = time_to_minutes(input_data.time)
+    new_end = new_start + input_data.duration
     
     # CONFLICT DETECTION: Check for time overlaps with same doctor
-    for existing_apt in appointments_db:
-        # Only check same doctor on same date
-        if (existing_apt["doctor_name"] == input_data.doctor_name and 
-            existing_apt["date"] == input_data.date and
-            existing_apt["status"] not in ["Cancelled", "Completed"]):
+    # Only appointments for the same doctor on the same date are candidates.
+    # The bucket is sorted by start, so only entries starting before new_end
+    # and no more than MAX_DURATION_MINUTES before new_start can overlap.
+    key = (input_data.doctor_name, input_data.date)
+    bucket = _by_doctor_date.get(key, [])
+    lo = bisect_right(bucket, new_start - MAX_DURATION_MINUTES, key=_start_key)
+    hi = bisect_left(bucket, new_end, key=_start_key)
+    has_conflict = lo < hi and any_overlap(
+        _busy_starts[key][lo:hi], _busy_ends[key][lo:hi], new_start, new_end
+    )
+    
+    # Walk the window again only to name the conflicting appointment
+    for i in range(hi - 1, lo - 1, -1) if has_conflict else ():
+        existing_start, existing_end, existing_apt = bucket[i]
+        if (existing_apt["status"] not in NON_BLOCKING_STATUSES and
+            check_time_overlap(new_start, new_end, existing_start, existing_end)):
             
+            # String formatting only happens on the error path
             existing_end_time = calculate_end_time(
                 existing_apt["time"], 
                 existing_apt["duration"]
             )
-            
-            # Check for overlap
-            if check_time_overlap(
-                input_data.time, new_end_time,
-                existing_apt["time"], existing_end_time
-            ):
-                raise ValueError(
-                    f"Time conflict: {input_data.doctor_name} already has an appointment "
-                    f"from {existing_apt['time']} to {existing_end_time} on {input_data.date}"
-                )
+            raise ValueError(
+                f"Time conflict: {input_data.doctor_name} already has an appointment "
+                f"from {existing_apt['time']} to {existing_end_time} on {input_data.date}"
+            )
     
     # Create new appointment
     new_appointment = {
@@ -307,11 +468,12 @@ def create_appointment(input_data: CreateAppointmentInput) -> AppointmentRespons
         "doctor_name": input_data.doctor_name,
         "status": input_data.status or "Scheduled",
         "mode": input_data.mode,
-        "created_at": datetime.utcnow().isoformat() + "Z"
+        "created_at": datetime.now(timezone.utc).strftime(CREATED_AT_FORMAT)
     }
     
     # Add to mock database (in production: INSERT INTO)
-    appointments_db.append(new_appointment)
+    appointments_db[new_id] = new_appointment
+    _index_appointment(new_appointment)
     
     """
     PRODUCTION: Trigger AppSync subscription
@@ -321,7 +483,7 @@ def create_appointment(input_data: CreateAppointmentInput) -> AppointmentRespons
     )
     """
     
-    return AppointmentResponse(**new_appointment)
+    return new_appointment
 
 
 def update_appointment_status(appointment_id: str, new_status: str) -> AppointmentResponse:
@@ -346,27 +508,29 @@ def update_appointment_status(appointment_id: str, new_status: str) -> Appointme
     Raises:
         ValueError: If appointment not found
     """
-    for apt in appointments_db:
-        if apt["id"] == appointment_id:
-            apt["status"] = new_status
-            
-            """
-            PRODUCTION: AppSync subscription trigger
-            await pubsub.publish(
-                topic=f"appointmentUpdated_{appointment_id}",
-                payload={"id": appointment_id, "status": new_status}
-            )
-            
-            ABDM COMPLIANCE: Audit log
-            await db.execute(
-                INSERT INTO audit_log (entity_type, entity_id, action, user_id, timestamp)
-                VALUES ('appointment', $1, 'status_update', $2, NOW())
-            )
-            """
-            
-            return AppointmentResponse(**apt)
+    apt = appointments_db.get(appointment_id)
+    if apt is None:
+        raise ValueError(f"Appointment with ID {appointment_id} not found")
+    
+    apt["status"] = new_status
+    # Status decides whether the slot blocks new bookings
+    _reindex_status(apt)
+    
+    """
+    PRODUCTION: AppSync subscription trigger
+    await pubsub.publish(
+        topic=f"appointmentUpdated_{appointment_id}",
+        payload={"id": appointment_id, "status": new_status}
+    )
     
-    raise ValueError(f"Appointment with ID {appointment_id} not found")
+    ABDM COMPLIANCE: Audit log
+    await db.execute(
+        INSERT INTO audit_log (entity_type, entity_id, action, user_id, timestamp)
+        VALUES ('appointment', $1, 'status_update', $2, NOW())
+    )
+    """
+    
+    return AppointmentResponse(**apt)
 
 
 def delete_appointment(appointment_id: str) -> bool:
@@ -388,22 +552,22 @@ def delete_appointment(appointment_id: str) -> bool:
     Raises:
         ValueError: If appointment not found
     """
-    for i, apt in enumerate(appointments_db):
-        if apt["id"] == appointment_id:
-            appointments_db.pop(i)
-            
-            """
-            PRODUCTION: Soft delete
-            await db.execute(
-                UPDATE appointments 
-                SET deleted_at = NOW(), status = 'Cancelled'
-                WHERE id = $1
-            )
-            """
-            
-            return True
+    apt = appointments_db.pop(appointment_id, None)
+    if apt is None:
+        raise ValueError(f"Appointment with ID {appointment_id} not found")
+    
+    _unindex_appointment(apt)
+    
+    """
+    PRODUCTION: Soft delete
+    await db.execute(
+        UPDATE appointments 
+        SET deleted_at = NOW(), status = 'Cancelled'
+        WHERE id = $1
+    )
+    """
     
-    raise ValueError(f"Appointment with ID {appointment_id} not found")
+    return True
 
 
 # ==============================================
@@ -4,9 +4,14 @@ Used for sophisticated overlap detection with buffer time support
 """
 
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Tuple, Optional
 
 
+# Valid inputs form a small finite set: 1440 zero-padded times plus unpadded
+# spellings such as "9:5" or "09:5" that strptime also accepts. Clients send the
+# padded form in practice, so the working set fits well within the cache
+@lru_cache(maxsize=2048)
 def parse_time(time_str: str) -> datetime:
     """Parse time string (HH:MM) to datetime object"""
     return datetime.strptime(time_str, '%H:%M')
@@ -21,8 +26,11 @@ def add_minutes(time_str: str, minutes: int) -> str:
 
 def time_to_minutes(time_str: str) -> int:
     """Convert HH:MM to minutes since midnight for easier comparison"""
-    time_obj = parse_time(time_str)
-    return time_obj.hour * 60 + time_obj.minute
+    hours, minutes = time_str.split(":")
+    h, m = int(hours), int(minutes)
+    if not (0 <= h < 24 and 0 <= m < 60):
+        raise ValueError(f"Invalid time '{time_str}': expected HH:MM (24-hour)")
+    return h * 60 + m
 
 
 def detect_overlap(